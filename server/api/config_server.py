@@ -10,7 +10,11 @@ static configuration data that doesn't require pipeline access.
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+import hashlib
+from typing import Annotated, Final
+
+import orjson
+from fastapi import APIRouter, Header, Response
 from pydantic import BaseModel
 
 from processors.llm import (
@@ -36,11 +40,43 @@ class DefaultSectionsResponse(BaseModel):
     dictionary: str
 
 
+# Default prompts are module constants, so serialize once at import and serve
+# the cached bytes with an ETag so clients can revalidate with a 304.
+_DEFAULT_SECTIONS_JSON: Final[bytes] = orjson.dumps(
+    {
+        "main": MAIN_PROMPT_DEFAULT,
+        "advanced": ADVANCED_PROMPT_DEFAULT,
+        "dictionary": DICTIONARY_PROMPT_DEFAULT,
+    }
+)
+_DEFAULT_SECTIONS_ETAG: Final[str] = (
+    f'"{hashlib.blake2b(_DEFAULT_SECTIONS_JSON, digest_size=8).hexdigest()}"'
+)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header value matches the given ETag."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
 @config_router.get("/api/prompt/sections/default", response_model=DefaultSectionsResponse)
-async def get_default_sections() -> DefaultSectionsResponse:
-    """Get default prompts for each section."""
-    return DefaultSectionsResponse(
-        main=MAIN_PROMPT_DEFAULT,
-        advanced=ADVANCED_PROMPT_DEFAULT,
-        dictionary=DICTIONARY_PROMPT_DEFAULT,
+async def get_default_sections(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get default prompts for each section.
+
+    The payload is serialized once at import, so the model is only used for
+    the OpenAPI schema. Returns 304 Not Modified when the client's cached copy
+    is still current.
+    """
+    headers = {"ETag": _DEFAULT_SECTIONS_ETAG, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, _DEFAULT_SECTIONS_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=_DEFAULT_SECTIONS_JSON,
+        media_type="application/json",
+        headers=headers,
     )
@@ -10,23 +10,28 @@ Usage:
 """
 
 import asyncio
+import sys
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Annotated, Any, Final, cast
+from typing import Annotated, Any, Final
 
 import typer
 import uvicorn
 from fastapi import FastAPI, Request
+from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import HeartbeatFrame
+from pipecat.observers.base_observer import BaseObserver
 from pipecat.observers.loggers.user_bot_latency_log_observer import UserBotLatencyLogObserver
 from pipecat.pipeline.llm_switcher import LLMSwitcher
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.service_switcher import ServiceSwitcher, ServiceSwitcherStrategyManual
 from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIObserver, RTVIProcessor
 from pipecat.transports.base_transport import TransportParams
 from pipecat.transports.smallwebrtc.connection import IceServer, SmallWebRTCConnection
@@ -48,7 +53,7 @@ from services.providers import (
     get_available_llm_providers,
     get_available_stt_providers,
 )
-from utils.logger import configure_logging
+from utils.logger import configure_logging, is_log_level_enabled
 from utils.observers import PipelineLogObserver
 
 # ICE servers for WebRTC NAT traversal
@@ -85,10 +90,16 @@ async def run_pipeline(
 
     # Create fresh service instances for this connection to ensure isolation
     # between concurrent clients. Each client gets independent WebSocket
-    # connections to STT/LLM providers.
+    # connections to STT/LLM providers. Construction stays on the event loop
+    # because some provider clients (e.g. Google Speech's gRPC client) bind to
+    # the running loop when created.
     stt_services = create_all_available_stt_services(services.settings)
     llm_services = create_all_available_llm_services(services.settings)
 
+    # Loading the Silero ONNX model blocks for tens of milliseconds, so do it in
+    # a worker thread to avoid stalling other connections
+    vad_analyzer = await asyncio.to_thread(SileroVADAnalyzer)
+
     # Create transport using the WebRTC connection
     # (client connects with enableMic: false, only enables when recording starts)
     transport = SmallWebRTCTransport(
@@ -96,14 +107,12 @@ async def run_pipeline(
         params=TransportParams(
             audio_in_enabled=True,
             audio_out_enabled=False,  # No audio output for dictation
-            vad_analyzer=SileroVADAnalyzer(),
+            vad_analyzer=vad_analyzer,
         ),
     )
 
     # Create service switchers for this connection
-    from pipecat.pipeline.base_pipeline import FrameProcessor as PipecatFrameProcessor
-
-    stt_service_list = cast(list[PipecatFrameProcessor], list(stt_services.values()))
+    stt_service_list: list[FrameProcessor] = list(stt_services.values())
     llm_service_list = list(llm_services.values())
 
     stt_switcher = ServiceSwitcher(
@@ -170,7 +179,15 @@ async def run_pipeline(
         ]
     )
 
-    # Create pipeline task with RTVIObserver to send bot-llm-text to client
+    # RTVIObserver sends bot-llm-text to the client. Logging observers see every
+    # frame push, so only attach them when their output can reach the log sink.
+    observers: list[BaseObserver] = [RTVIObserver(rtvi_processor)]
+    if is_log_level_enabled("INFO"):
+        observers.append(UserBotLatencyLogObserver())
+    if is_log_level_enabled("SUCCESS"):
+        observers.append(PipelineLogObserver())
+
+    # Create pipeline task
     task = PipelineTask(
         pipeline,
         params=PipelineParams(
@@ -180,11 +197,7 @@ async def run_pipeline(
             enable_heartbeats=True,
         ),
         idle_timeout_frames=(HeartbeatFrame,),
-        observers=[
-            UserBotLatencyLogObserver(),
-            RTVIObserver(rtvi_processor),  # Sends bot-llm-text messages to client
-            PipelineLogObserver(),
-        ],
+        observers=observers,
     )
 
     # Set up event handlers
@@ -249,32 +262,42 @@ async def lifespan(fastapi_app: FastAPI):  # noqa: ANN201
         return
 
     # Cancel all active pipeline tasks for graceful shutdown
-    if services.active_pipeline_tasks:
-        logger.info(f"Cancelling {len(services.active_pipeline_tasks)} active pipeline tasks...")
-        for task in list(services.active_pipeline_tasks):
+    pipeline_tasks = list(services.active_pipeline_tasks)
+    if pipeline_tasks:
+        logger.info(f"Cancelling {len(pipeline_tasks)} active pipeline tasks...")
+        for task in pipeline_tasks:
             task.cancel()
-        # Wait for all tasks to complete with timeout to avoid hanging
-        try:
-            async with asyncio.timeout(5.0):
-                await asyncio.gather(*services.active_pipeline_tasks, return_exceptions=True)
-            logger.info("All pipeline tasks cancelled")
-        except TimeoutError:
-            logger.warning("Timeout waiting for pipeline tasks to cancel")
-
-    # SmallWebRTCRequestHandler manages all connections - close them cleanly
-    await services.webrtc_handler.close()
-    logger.success("All connections cleaned up")
 
+    # SmallWebRTCRequestHandler manages all connections - close them while the
+    # pipelines wind down, since the two are independent. The close is shielded
+    # so a timeout only stops waiting on the pipelines.
+    close_connections = asyncio.create_task(services.webrtc_handler.close())
+    try:
+        async with asyncio.timeout(5.0):
+            await asyncio.gather(
+                *pipeline_tasks, asyncio.shield(close_connections), return_exceptions=True
+            )
+        logger.info("Pipeline tasks and connections closed")
+    except TimeoutError:
+        logger.warning("Timeout waiting for pipeline tasks and connections to close")
+
+    await close_connections
+    logger.success("All connections cleaned up")
 
-# Create FastAPI app
-app = FastAPI(title="Tambourine Server", lifespan=lifespan)
 
-# CORS for Tauri frontend
-app.add_middleware(
-    CORSMiddleware,  # type: ignore[invalid-argument-type]
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Create FastAPI app (orjson for all JSON responses, CORS for Tauri frontend)
+app = FastAPI(
+    title="Tambourine Server",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    middleware=[
+        Middleware(
+            CORSMiddleware,  # type: ignore[invalid-argument-type]
+            allow_origins=["*"],
+            allow_methods=["*"],
+            allow_headers=["*"],
+        ),
+    ],
 )
 
 # Include config routes
@@ -292,11 +315,11 @@ async def health_check() -> dict[str, str]:
 # =============================================================================
 
 
-@app.post("/api/offer")
+@app.post("/api/offer", response_model=None)
 async def webrtc_offer(
     webrtc_request: SmallWebRTCRequest,
     request: Request,
-) -> dict[str, str] | None:
+) -> ORJSONResponse:
     """Handle WebRTC offer from client using SmallWebRTCRequestHandler.
 
     This endpoint handles the WebRTC signaling handshake:
@@ -304,6 +327,9 @@ async def webrtc_offer(
     2. Creates or reuses a SmallWebRTCConnection via the handler
     3. Returns SDP answer to client
     4. Spawns the Pipecat pipeline as a background task
+
+    The answer is already a plain dict, so it is returned as a response
+    directly instead of being validated against a response model.
     """
     services: AppServices = request.app.state.services
 
@@ -318,7 +344,7 @@ async def webrtc_offer(
         webrtc_connection_callback=connection_callback,
     )
 
-    return answer
+    return ORJSONResponse(answer)
 
 
 @app.patch("/api/offer")
@@ -376,12 +402,13 @@ def main(
     logger.info("Press Ctrl+C to stop")
     logger.info("=" * 60)
 
-    # Run the server
+    # Run the server on uvloop where available (not supported on Windows)
     uvicorn.run(
         app,
         host=effective_host,
         port=effective_port,
         log_level="warning",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
 
 
@@ -14,7 +14,12 @@ from pipecat.frames.frames import ManuallySwitchServiceFrame
 from pipecat.processors.frame_processor import FrameDirection
 from pipecat.processors.frameworks.rtvi import RTVIProcessor, RTVIServerMessageFrame
 
-from services.provider_registry import LLMProviderId, STTProviderId
+from services.provider_registry import (
+    LLMProviderId,
+    STTProviderId,
+    get_llm_provider_labels,
+    get_stt_provider_labels,
+)
 
 if TYPE_CHECKING:
     from pipecat.pipeline.llm_switcher import LLMSwitcher
@@ -133,14 +138,14 @@ class ConfigurationHandler:
             await self._send_config_error(setting_name, f"Unknown provider: {provider_value}")
             return
 
-        if provider_id not in services:
+        service = services.get(provider_id)
+        if service is None:
             await self._send_config_error(
                 setting_name,
                 f"Provider '{provider_value}' not available (no API key configured)",
             )
             return
 
-        service = services[provider_id]
         await switcher.process_frame(
             ManuallySwitchServiceFrame(service=service),
             FrameDirection.DOWNSTREAM,
@@ -196,8 +201,6 @@ class ConfigurationHandler:
 
     async def _send_available_providers(self) -> None:
         """Send available providers with model info from instantiated services."""
-        from services.provider_registry import get_llm_provider_labels, get_stt_provider_labels
-
         stt_providers = self._build_provider_list(
             services=self._stt_services,
             labels=get_stt_provider_labels(),
@@ -0,0 +1,58 @@
+"""Tests for the config API endpoints."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.config_server import config_router
+from processors.llm import (
+    ADVANCED_PROMPT_DEFAULT,
+    DICTIONARY_PROMPT_DEFAULT,
+    MAIN_PROMPT_DEFAULT,
+)
+
+DEFAULT_SECTIONS_URL = "/api/prompt/sections/default"
+
+
+def _create_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(config_router)
+    return TestClient(app)
+
+
+class TestGetDefaultSections:
+    """Tests for the default prompt sections endpoint."""
+
+    def test_returns_default_prompts(self) -> None:
+        """Response body contains the default prompt for each section."""
+        response = _create_client().get(DEFAULT_SECTIONS_URL)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "main": MAIN_PROMPT_DEFAULT,
+            "advanced": ADVANCED_PROMPT_DEFAULT,
+            "dictionary": DICTIONARY_PROMPT_DEFAULT,
+        }
+
+    def test_includes_etag(self) -> None:
+        """Response carries a quoted ETag that is stable across requests."""
+        client = _create_client()
+        first = client.get(DEFAULT_SECTIONS_URL).headers["etag"]
+        second = client.get(DEFAULT_SECTIONS_URL).headers["etag"]
+        assert first.startswith('"')
+        assert first.endswith('"')
+        assert first == second
+
+    def test_matching_if_none_match_returns_not_modified(self) -> None:
+        """A matching If-None-Match header yields 304 with an empty body."""
+        client = _create_client()
+        etag = client.get(DEFAULT_SECTIONS_URL).headers["etag"]
+        response = client.get(DEFAULT_SECTIONS_URL, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_if_none_match_returns_payload(self) -> None:
+        """A non-matching If-None-Match header yields the full payload."""
+        response = _create_client().get(DEFAULT_SECTIONS_URL, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["main"] == MAIN_PROMPT_DEFAULT
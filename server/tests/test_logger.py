@@ -0,0 +1,36 @@
+"""Tests for logging configuration helpers."""
+
+import sys
+from collections.abc import Iterator
+
+import pytest
+from loguru import logger
+
+from utils import logger as logger_module
+from utils.logger import configure_logging, is_log_level_enabled
+
+
+@pytest.fixture
+def restore_logging(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Restore the configured level and loguru's default sink after the test."""
+    monkeypatch.setattr(logger_module, "_min_level_no", logger_module._min_level_no)
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+@pytest.mark.usefixtures("restore_logging")
+class TestIsLogLevelEnabled:
+    """Tests for is_log_level_enabled() tracking configure_logging()."""
+
+    def test_level_below_configured_minimum_is_disabled(self) -> None:
+        """SUCCESS records are dropped once logging is configured at WARNING."""
+        configure_logging("WARNING")
+        assert not is_log_level_enabled("SUCCESS")
+        assert is_log_level_enabled("WARNING")
+
+    def test_level_above_configured_minimum_is_enabled(self) -> None:
+        """SUCCESS records reach the sink once logging is configured at DEBUG."""
+        configure_logging("DEBUG")
+        assert is_log_level_enabled("SUCCESS")
+        assert is_log_level_enabled("DEBUG")
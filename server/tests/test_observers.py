@@ -0,0 +1,158 @@
+"""Tests for PipelineLogObserver frame dispatch."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from loguru import logger
+from pipecat.frames.frames import (
+    Frame,
+    LLMTextFrame,
+    MetricsFrame,
+    StartFrame,
+    TextFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+)
+from pipecat.observers.base_observer import FramePushed
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.stt_service import STTService
+from pipecat.transports.base_input import BaseInputTransport
+
+from utils.observers import PipelineLogObserver
+
+
+class _FakeSTTService(STTService):
+    """STT service stand-in; the observer only checks the source type."""
+
+    def __init__(self) -> None:
+        pass
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame]:
+        raise NotImplementedError
+
+
+class _FakeInputTransport(BaseInputTransport):
+    """Input transport stand-in; the observer only checks the source type."""
+
+    def __init__(self) -> None:
+        pass
+
+
+class _CustomTranscriptionFrame(TranscriptionFrame):
+    """Transcription subclass with no handler of its own."""
+
+
+def _log_pushes(
+    monkeypatch: pytest.MonkeyPatch,
+    pushes: list[tuple[FrameProcessor, Frame]],
+    min_level: str = "DEBUG",
+) -> list[str]:
+    """Push frames through a fresh observer and return the "LEVEL message" lines logged.
+
+    The configured minimum level is pinned to min_level so results do not
+    depend on whether an earlier test called configure_logging().
+    """
+    monkeypatch.setattr("utils.logger._min_level_no", logger.level(min_level).no)
+    observer = PipelineLogObserver()
+    messages: list[str] = []
+    sink_id = logger.add(
+        lambda message: messages.append(
+            f"{message.record['level'].name} {message.record['message']}"
+        ),
+        level="DEBUG",
+    )
+
+    async def push_all() -> None:
+        for source, frame in pushes:
+            await observer.on_push_frame(
+                FramePushed(
+                    source=source,
+                    destination=source,
+                    frame=frame,
+                    direction=FrameDirection.DOWNSTREAM,
+                    timestamp=0,
+                )
+            )
+
+    try:
+        asyncio.run(push_all())
+    finally:
+        logger.remove(sink_id)
+    return messages
+
+
+def _transcription(text: str) -> TranscriptionFrame:
+    return TranscriptionFrame(text=text, user_id="user", timestamp="")
+
+
+class TestPipelineLogObserver:
+    """Tests for PipelineLogObserver.on_push_frame() dispatch."""
+
+    def test_handled_frame_from_expected_source_is_logged(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A transcription pushed by the STT service is logged at INFO."""
+        messages = _log_pushes(monkeypatch, [(_FakeSTTService(), _transcription("hello"))])
+        assert messages == ["INFO TRANSCRIPTION: 'hello'"]
+
+    def test_handled_frame_from_wrong_source_falls_back_to_debug(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A handled frame type from an unexpected source gets the DEBUG fallback."""
+        messages = _log_pushes(
+            monkeypatch,
+            [
+                (_FakeSTTService(), UserStartedSpeakingFrame()),
+                (_FakeInputTransport(), StartFrame()),
+            ],
+        )
+        assert messages == [
+            "DEBUG Frame: UserStartedSpeakingFrame",
+            "DEBUG Frame: StartFrame",
+        ]
+
+    def test_fallback_suppressed_above_debug(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The DEBUG fallback is skipped when the configured level is INFO."""
+        messages = _log_pushes(
+            monkeypatch,
+            [
+                (_FakeSTTService(), UserStartedSpeakingFrame()),
+                (_FakeSTTService(), _transcription("hello")),
+            ],
+            min_level="INFO",
+        )
+        assert messages == ["INFO TRANSCRIPTION: 'hello'"]
+
+    def test_quiet_frames_are_not_logged(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Noisy frame types stay silent even when no handler accepts them."""
+        source = _FakeInputTransport()
+        messages = _log_pushes(
+            monkeypatch,
+            [
+                (source, TextFrame(text="text")),
+                (source, LLMTextFrame(text="llm text")),
+                (source, MetricsFrame(data=[])),
+                (source, _transcription("not from STT")),
+            ],
+        )
+        assert messages == []
+
+    def test_frame_subclass_uses_parent_handler(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A frame subclass resolves to the handler registered for its parent."""
+        frame = _CustomTranscriptionFrame(text="subclass", user_id="user", timestamp="")
+        messages = _log_pushes(monkeypatch, [(_FakeSTTService(), frame)])
+        assert messages == ["INFO TRANSCRIPTION: 'subclass'"]
+
+    def test_repeated_frame_type_uses_cached_dispatch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cached dispatch gives the same result as the first lookup for a type."""
+        messages = _log_pushes(
+            monkeypatch,
+            [
+                (_FakeSTTService(), _transcription("first")),
+                (_FakeSTTService(), _transcription("second")),
+            ],
+        )
+        assert messages == ["INFO TRANSCRIPTION: 'first'", "INFO TRANSCRIPTION: 'second'"]
@@ -2,34 +2,48 @@
 
 import os
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from loguru import logger
 
 if TYPE_CHECKING:
     from loguru import Record
 
+# Minimum level accepted by the configured sink (loguru's default sink is DEBUG)
+_min_level_no: int = logger.level("DEBUG").no
+
+
+# Pipecat warning logged whenever the WebRTC transport is idle between recordings
+_AUDIO_TIMEOUT_LOGGER_NAME: Final[str] = "pipecat.transports.smallwebrtc.transport"
+_AUDIO_TIMEOUT_MESSAGE_PREFIX: Final[str] = "Timeout: No audio frame received"
+
 
 def _should_log(record: "Record") -> bool:
     """Filter out known harmless warnings."""
-    # Filter out pipecat timeout warnings (harmless when not streaming audio)
+    # Filter out pipecat timeout warnings (harmless when not streaming audio).
+    # The cheap logger name check rules out nearly every record before the
+    # message is inspected.
     return not (
-        record["name"] == "pipecat.transports.smallwebrtc.transport"
-        and "Timeout: No audio frame received" in record["message"]
+        record["name"] == _AUDIO_TIMEOUT_LOGGER_NAME
+        and record["message"].startswith(_AUDIO_TIMEOUT_MESSAGE_PREFIX)
     )
 
 
+# Both format variants are built once; returning the same string objects lets
+# loguru's memoized color parsing hit its cache without re-hashing a new string.
+_LOG_FORMAT_BASE: Final[str] = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+_LOG_FORMAT: Final[str] = _LOG_FORMAT_BASE + "\n{exception}"
+_LOG_FORMAT_WITH_EXTRA: Final[str] = _LOG_FORMAT_BASE + " {extra}\n{exception}"
+
+
 def _log_format(record: "Record") -> str:
     """Custom format function that only shows extra when present."""
-    base = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    )
-    if record["extra"]:
-        return base + " {extra}\n{exception}"
-    return base + "\n{exception}"
+    return _LOG_FORMAT_WITH_EXTRA if record["extra"] else _LOG_FORMAT
 
 
 def configure_logging(log_level: str | None = None) -> None:
@@ -48,6 +62,9 @@ def configure_logging(log_level: str | None = None) -> None:
     else:
         log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
 
+    global _min_level_no
+    _min_level_no = logger.level(log_level_str).no
+
     # Remove default handler
     logger.remove()
 
@@ -59,3 +76,14 @@ def configure_logging(log_level: str | None = None) -> None:
         colorize=True,
         filter=_should_log,
     )
+
+
+def is_log_level_enabled(level: str) -> bool:
+    """Check whether records at the given level reach the configured sink.
+
+    Lets hot paths skip building log messages that would be dropped anyway.
+
+    Args:
+        level: Loguru level name (e.g., "DEBUG", "INFO")
+    """
+    return logger.level(level).no >= _min_level_no
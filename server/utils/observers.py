@@ -3,7 +3,11 @@
 Filters frames by source to avoid duplicate logs as frames propagate through the pipeline.
 """
 
+from collections.abc import Callable
+from typing import Any
+
 from pipecat.frames.frames import (
+    Frame,
     InputAudioRawFrame,
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
@@ -17,13 +21,25 @@ from pipecat.frames.frames import (
     UserStoppedSpeakingFrame,
 )
 from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.frame_processor import FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIServerMessageFrame
 from pipecat.services.llm_service import LLMService
 from pipecat.services.stt_service import STTService
 from pipecat.transports.base_input import BaseInputTransport
 from pipecat.transports.base_output import BaseOutputTransport
 
-from utils.logger import logger
+from utils.logger import is_log_level_enabled, logger
+
+# Handles a frame pushed from a source; returns False to fall back to debug logging
+type _FrameHandler = Callable[[FrameProcessor, Any], bool]
+
+# Frames too noisy for the debug-level fallback log
+_QUIET_FRAME_TYPES: tuple[type[Frame], ...] = (
+    UserSpeakingFrame,
+    MetricsFrame,
+    TextFrame,
+    LLMTextFrame,
+)
 
 
 class PipelineLogObserver(BaseObserver):
@@ -38,6 +54,10 @@ class PipelineLogObserver(BaseObserver):
 
     Logs at DEBUG level:
     - Other frames (excluding noisy UserSpeakingFrame and MetricsFrame)
+
+    Observers see every frame push in the pipeline, so handlers are looked up
+    by exact frame type in a dispatch table. The first lookup for a type walks
+    its MRO and caches the result, preserving isinstance semantics.
     """
 
     def __init__(self) -> None:
@@ -48,6 +68,21 @@ class PipelineLogObserver(BaseObserver):
         self._audio_frame_count: int = 0
         # Track speaking state to deduplicate speech events from multiple sources
         self._is_speaking: bool = False
+        self._handlers: dict[type, _FrameHandler] = {
+            StartFrame: self._on_start,
+            InputAudioRawFrame: self._on_input_audio,
+            TranscriptionFrame: self._on_transcription,
+            UserStartedSpeakingFrame: self._on_user_started_speaking,
+            UserStoppedSpeakingFrame: self._on_user_stopped_speaking,
+            LLMFullResponseStartFrame: self._on_llm_response_start,
+            LLMTextFrame: self._on_llm_text,
+            LLMFullResponseEndFrame: self._on_llm_response_end,
+            RTVIServerMessageFrame: self._on_rtvi_server_message,
+        }
+        self._dispatch_cache: dict[type[Frame], tuple[_FrameHandler | None, bool]] = {}
+        # The debug fallback fires for most frame pushes, so resolve it to a no-op
+        # up front when DEBUG records would be dropped by the sink
+        self._debug_enabled: bool = is_log_level_enabled("DEBUG")
 
     async def on_push_frame(self, data: FramePushed) -> None:
         """Handle frame push events and log key pipeline activities.
@@ -55,58 +90,110 @@ class PipelineLogObserver(BaseObserver):
         Args:
             data: The frame push event data containing source, frame, and other info.
         """
-        src = data.source
         frame = data.frame
+        handler, log_fallback = self._resolve_dispatch(type(frame))
+        if handler is not None and handler(data.source, frame):
+            return
 
+        # Log other frames at debug level (skip noisy ones)
+        if log_fallback:
+            logger.debug("Frame: {}", type(frame).__name__)
+
+    def _resolve_dispatch(self, frame_type: type[Frame]) -> tuple[_FrameHandler | None, bool]:
+        """Get the handler and debug-fallback flag for a frame type, caching the result."""
+        entry = self._dispatch_cache.get(frame_type)
+        if entry is None:
+            handler = next(
+                (self._handlers[cls] for cls in frame_type.__mro__ if cls in self._handlers),
+                None,
+            )
+            log_fallback = self._debug_enabled and not issubclass(frame_type, _QUIET_FRAME_TYPES)
+            entry = (handler, log_fallback)
+            self._dispatch_cache[frame_type] = entry
+        return entry
+
+    def _on_start(self, src: FrameProcessor, _frame: StartFrame) -> bool:
         # Log pipeline start when it reaches the output transport (end of pipeline)
-        if isinstance(frame, StartFrame) and isinstance(src, BaseOutputTransport):
-            logger.success("Pipeline started")
-
-        # Log audio frames from input transport (first few and periodic)
-        elif isinstance(frame, InputAudioRawFrame) and isinstance(src, BaseInputTransport):
-            self._audio_frame_count += 1
-            if self._audio_frame_count % 500 == 0:
-                logger.info(
-                    f"Audio frame #{self._audio_frame_count}: "
-                    f"{len(frame.audio)} bytes, {frame.sample_rate}Hz, {frame.num_channels}ch"
-                )
-
+        if not isinstance(src, BaseOutputTransport):
+            return False
+        logger.success("Pipeline started")
+        return True
+
+    def _on_input_audio(self, src: FrameProcessor, frame: InputAudioRawFrame) -> bool:
+        # Log audio frames from input transport (periodic)
+        if not isinstance(src, BaseInputTransport):
+            return False
+        self._audio_frame_count += 1
+        if self._audio_frame_count % 500 == 0:
+            logger.info(
+                "Audio frame #{}: {} bytes, {}Hz, {}ch",
+                self._audio_frame_count,
+                len(frame.audio),
+                frame.sample_rate,
+                frame.num_channels,
+            )
+        return True
+
+    def _on_transcription(self, src: FrameProcessor, frame: TranscriptionFrame) -> bool:
         # Log transcription from STT service
-        elif isinstance(frame, TranscriptionFrame) and isinstance(src, STTService):
-            logger.info(f"TRANSCRIPTION: '{frame.text}'")
-
-        # Log speech start/stop from input transport (where VAD runs)
+        if not isinstance(src, STTService):
+            return False
+        logger.info("TRANSCRIPTION: '{}'", frame.text)
+        return True
+
+    def _on_user_started_speaking(
+        self, src: FrameProcessor, _frame: UserStartedSpeakingFrame
+    ) -> bool:
+        # Log speech start from input transport (where VAD runs)
         # Use state tracking to deduplicate - same event may come from multiple sources
-        elif isinstance(frame, UserStartedSpeakingFrame) and isinstance(src, BaseInputTransport):
-            if not self._is_speaking:
-                self._is_speaking = True
-                logger.info("Speech started")
-        elif isinstance(frame, UserStoppedSpeakingFrame) and isinstance(src, BaseInputTransport):
-            if self._is_speaking:
-                self._is_speaking = False
-                logger.info("Speech stopped")
-
-        # Accumulate and log LLM response from LLM service
+        if not isinstance(src, BaseInputTransport):
+            return False
+        if not self._is_speaking:
+            self._is_speaking = True
+            logger.info("Speech started")
+        return True
+
+    def _on_user_stopped_speaking(
+        self, src: FrameProcessor, _frame: UserStoppedSpeakingFrame
+    ) -> bool:
+        # Log speech stop from input transport, deduplicated like speech start
+        if not isinstance(src, BaseInputTransport):
+            return False
+        if self._is_speaking:
+            self._is_speaking = False
+            logger.info("Speech stopped")
+        return True
+
+    def _on_llm_response_start(
+        self, src: FrameProcessor, _frame: LLMFullResponseStartFrame
+    ) -> bool:
+        # Start accumulating the LLM response from LLM service
+        if not isinstance(src, LLMService):
+            return False
+        self._llm_accumulator = ""
+        self._is_accumulating = True
+        return True
+
+    def _on_llm_text(self, src: FrameProcessor, frame: LLMTextFrame) -> bool:
         # Use LLMTextFrame (not TextFrame) - this is what LLM services output
-        elif isinstance(frame, LLMFullResponseStartFrame) and isinstance(src, LLMService):
-            self._llm_accumulator = ""
-            self._is_accumulating = True
-        elif (
-            isinstance(frame, LLMTextFrame)
-            and self._is_accumulating
-            and isinstance(src, LLMService)
-        ):
-            self._llm_accumulator += frame.text
-        elif isinstance(frame, LLMFullResponseEndFrame) and isinstance(src, LLMService):
-            self._is_accumulating = False
-            if self._llm_accumulator.strip():
-                logger.info(f"Cleaned text: '{self._llm_accumulator.strip()}'")
-            self._llm_accumulator = ""
-
+        if not (self._is_accumulating and isinstance(src, LLMService)):
+            return False
+        self._llm_accumulator += frame.text
+        return True
+
+    def _on_llm_response_end(self, src: FrameProcessor, _frame: LLMFullResponseEndFrame) -> bool:
+        # Log the accumulated LLM response once it completes
+        if not isinstance(src, LLMService):
+            return False
+        self._is_accumulating = False
+        if self._llm_accumulator.strip():
+            logger.info("Cleaned text: '{}'", self._llm_accumulator.strip())
+        self._llm_accumulator = ""
+        return True
+
+    def _on_rtvi_server_message(self, src: FrameProcessor, frame: RTVIServerMessageFrame) -> bool:
         # Log RTVI server messages when sent from output transport
-        elif isinstance(frame, RTVIServerMessageFrame) and isinstance(src, BaseOutputTransport):
-            logger.info(f"Sending to client: {frame.data}")
-
-        # Log other frames at debug level (skip noisy ones)
-        elif not isinstance(frame, (UserSpeakingFrame, MetricsFrame, TextFrame, LLMTextFrame)):
-            logger.debug(f"Frame: {type(frame).__name__}")
+        if not isinstance(src, BaseOutputTransport):
+            return False
+        logger.info("Sending to client: {}", frame.data)
+        return True